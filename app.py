@@ -4,20 +4,88 @@ SQL Interview Prep App - Main Application
 Interactive CLI for practicing SQL interview questions
 """
 
+import glob
+import itertools
 import os
+import pickle
+import random
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from typing import Optional, List, Dict
 import utils
 
 
+# Control words recognized in the multi-line query collectors
+_SENTINELS = frozenset({'END', 'SKIP', 'SOLUTION', 'BACK', 'SCHEMA', 'CLEAR'})
+
+_DIFF_EMOJI = {
+    "easy": "🟢",
+    "medium": "🟡",
+    "hard": "🔴"
+}
+
+
 class SQLInterviewApp:
     """Main application class for SQL interview preparation"""
 
+    # Constant banners are assembled once at class-creation time instead
+    # of being rebuilt from string multiplies on every menu tick
+    _BAR = "=" * 60
+    # Sandbox fetch cap; format_table previews far fewer rows anyway
+    _SANDBOX_LIMIT = 1000
+    _MAIN_MENU = "\n".join([
+        "\n" + _BAR,
+        "SQL INTERVIEW PREP - Main Menu",
+        _BAR,
+        "1. Browse Questions",
+        "2. Practice by Difficulty",
+        "3. Random Question",
+        "4. View Statistics",
+        "5. SQL Sandbox (Free Query Mode)",
+        "6. View Database Schema",
+        "7. Setup Database",
+        "8. Test Database Connection",
+        "9. Exit",
+        _BAR,
+    ])
+    _SANDBOX_BANNER = "\n".join([
+        "\n" + _BAR,
+        "SQL SANDBOX - Free Query Mode",
+        _BAR,
+        "Execute any SQL query against the database.",
+        "Type 'BACK' to return to main menu",
+        "Type 'SCHEMA' to view database schema",
+        "Type 'CLEAR' to clear the screen",
+        _BAR,
+    ])
+
     def __init__(self):
         """Initialize the application"""
-        load_dotenv()
+        # Child processes inherit the parsed .env values through
+        # os.environ, so skip the filesystem scan when already loaded
+        if not os.environ.get("_DOTENV_LOADED"):
+            load_dotenv()
+            os.environ["_DOTENV_LOADED"] = "1"
         self.questions = []
+        self._by_difficulty = {}
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._solution_cache = {}
+        self._cmp_cache = OrderedDict()
+        self.cache_path = os.path.expanduser("~/.sql_prep_cache.pkl")
+        # O(1) menu dispatch instead of an if/elif ladder in run()
+        self._actions = {
+            "1": self.browse_questions,
+            "2": self.practice_by_difficulty,
+            "3": self.random_question,
+            "4": self.show_statistics,
+            "5": self.sandbox_mode,
+            "6": self.view_schema,
+            "7": self.setup_database,
+            "8": self.test_connection,
+            "9": self._exit,
+        }
         self.current_question = None
         self.stats = {
             "attempted": 0,
@@ -25,54 +93,74 @@ class SQLInterviewApp:
             "incorrect": 0
         }
 
+    def _question_file_mtimes(self) -> Dict[str, float]:
+        """Map each question JSON file to its mtime for cache validation"""
+        return {
+            path: os.path.getmtime(path)
+            for path in sorted(glob.glob(os.path.join("data", "*.json")))
+        }
+
     def load_questions(self, difficulty: str = "all") -> None:
-        """Load questions from JSON files"""
-        self.questions = utils.load_questions(difficulty)
+        """Load questions, using a pickle cache keyed by source file mtimes"""
+        mtimes = self._question_file_mtimes()
+        questions = None
+
+        # Try the on-disk cache first; a single pickle read beats re-parsing
+        # every JSON file when nothing has changed
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached_mtimes, cached_questions = pickle.load(f)
+            if cached_mtimes == mtimes:
+                questions = cached_questions
+        except (OSError, pickle.PickleError, ValueError, EOFError):
+            pass
+
+        if questions is None:
+            questions = utils.load_questions("all")
+            try:
+                with open(self.cache_path, "wb") as f:
+                    pickle.dump((mtimes, questions), f)
+            except OSError:
+                pass
+
+        # Filter in-memory so all difficulties share the same cache entry
+        if difficulty == "all":
+            self.questions = questions
+        else:
+            self.questions = [q for q in questions
+                              if q.get("difficulty") == difficulty]
+
+        # Bucket by difficulty once so menu filtering is an O(1) lookup
+        self._by_difficulty = {}
+        for q in self.questions:
+            self._by_difficulty.setdefault(q.get("difficulty", ""), []).append(q)
+
         print(f"\n✓ Loaded {len(self.questions)} questions")
 
     def display_menu(self) -> None:
         """Display main menu"""
-        print("\n" + "=" * 60)
-        print("SQL INTERVIEW PREP - Main Menu")
-        print("=" * 60)
-        print("1. Browse Questions")
-        print("2. Practice by Difficulty")
-        print("3. Random Question")
-        print("4. View Statistics")
-        print("5. SQL Sandbox (Free Query Mode)")
-        print("6. View Database Schema")
-        print("7. Setup Database")
-        print("8. Test Database Connection")
-        print("9. Exit")
-        print("=" * 60)
+        print(self._MAIN_MENU)
 
     def display_question_list(self, questions: List[Dict]) -> None:
         """Display list of questions"""
-        print("\n" + "=" * 60)
-        print("Available Questions")
-        print("=" * 60)
+        # Build the whole listing and write it in one go instead of one
+        # print() (lock + flush) per line
+        lines = ["\n" + "=" * 60, "Available Questions", "=" * 60]
 
         for i, q in enumerate(questions, 1):
-            difficulty_emoji = {
-                "easy": "🟢",
-                "medium": "🟡",
-                "hard": "🔴"
-            }.get(q.get("difficulty", ""), "⚪")
+            difficulty_emoji = _DIFF_EMOJI.get(q.get("difficulty", ""), "⚪")
 
             topics = ", ".join(q.get("topics", []))
-            print(f"{i}. {difficulty_emoji} [{q.get('difficulty', 'N/A').upper()}] {q['title']}")
+            lines.append(f"{i}. {difficulty_emoji} [{q.get('difficulty', 'N/A').upper()}] {q['title']}")
             if topics:
-                print(f"   Topics: {topics}")
+                lines.append(f"   Topics: {topics}")
 
-        print("=" * 60)
+        lines.append("=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_question(self, question: Dict) -> None:
         """Display a question"""
-        difficulty_emoji = {
-            "easy": "🟢",
-            "medium": "🟡",
-            "hard": "🔴"
-        }.get(question.get("difficulty", ""), "⚪")
+        difficulty_emoji = _DIFF_EMOJI.get(question.get("difficulty", ""), "⚪")
 
         print("\n" + "=" * 60)
         print(f"{difficulty_emoji} Question #{question['id']}: {question['title']}")
@@ -91,69 +179,141 @@ class SQLInterviewApp:
 
         print("\n" + "-" * 60)
 
+    def _read_block(self, query_lines: List[str]) -> tuple:
+        """
+        Collect query lines from stdin until a control word is entered
+
+        Reads with sys.stdin.readline in a tight loop — unlike input()
+        there is no per-line prompt redisplay or stdout flush, which
+        matters when a multi-hundred-line query is pasted. Body lines are
+        appended to query_lines in place.
+
+        Returns:
+            Tuple of (control word, raw line); EOF is reported as 'END'
+        """
+        readline = sys.stdin.readline
+        while True:
+            line = readline()
+            if not line:
+                return 'END', ''
+            line = line.rstrip('\n')
+            stripped = line.strip()
+            cmd = stripped.upper() if len(stripped) <= 10 else ''
+            if cmd in _SENTINELS:
+                return cmd, line
+            query_lines.append(line)
+
     def practice_question(self, question: Dict) -> None:
         """Practice a specific question"""
         self.current_question = question
         self.display_question(question)
 
-        print("\nEnter your SQL query (type 'END' on a new line when done):")
-        print("Type 'SKIP' to skip this question")
-        print("Type 'SOLUTION' to see the solution")
-        print("-" * 60)
-
-        # Collect multi-line query
-        query_lines = []
+        # Iterative retry loop: on error only the prompt is repeated, the
+        # question itself is rendered once (and no recursion frames pile up)
         while True:
-            line = input()
-            if line.strip().upper() == 'END':
-                break
-            elif line.strip().upper() == 'SKIP':
-                print("\nQuestion skipped.")
-                return
-            elif line.strip().upper() == 'SOLUTION':
-                self.show_solution(question)
-                return
-            query_lines.append(line)
+            print("\nEnter your SQL query (type 'END' on a new line when done):")
+            print("Type 'SKIP' to skip this question")
+            print("Type 'SOLUTION' to see the solution")
+            print("-" * 60)
 
-        user_query = "\n".join(query_lines).strip()
+            # Collect multi-line query
+            query_lines = []
+            while True:
+                cmd, raw = self._read_block(query_lines)
+                if cmd == 'END':
+                    break
+                elif cmd == 'SKIP':
+                    print("\nQuestion skipped.")
+                    return
+                elif cmd == 'SOLUTION':
+                    self.show_solution(question)
+                    return
+                # Other control words are plain text in this context
+                query_lines.append(raw)
 
-        if not user_query:
-            print("\n❌ No query entered.")
-            return
+            user_query = "\n".join(query_lines).strip()
 
-        # Execute user's query
-        print("\n⏳ Executing your query...")
-        user_result = utils.run_user_query(user_query)
+            if not user_query:
+                print("\n❌ No query entered.")
+                return
+
+            # Run the user's query and the expected solution concurrently;
+            # they are independent round-trips that block on the DB
+            print("\n⏳ Executing your query...")
+            f_user = self._pool.submit(utils.run_user_query, user_query)
+            f_expected = None
+            if question.get("solution"):
+                f_expected = self._pool.submit(self._exec_solution, question)
+            user_result = f_user.result()
+
+            if user_result["success"]:
+                break
 
-        if not user_result["success"]:
             print(f"\n❌ Query Error: {user_result['error']}")
             self.stats["attempted"] += 1
             self.stats["incorrect"] += 1
 
             retry = input("\nTry again? (y/n): ").strip().lower()
-            if retry == 'y':
-                self.practice_question(question)
-            return
+            if retry != 'y':
+                return
 
         # Execute expected query
         print("✓ Query executed successfully!")
         print("\n📊 Your Results:")
-        print(utils.format_table(user_result["results"], user_result["columns"]))
+        if user_result["results"]:
+            print(utils.format_table(user_result["results"],
+                                     user_result["columns"]))
+        else:
+            print("(no rows)")
 
         # Get expected results
-        expected_result = utils.run_user_query(question["solution"])
+        expected_result = f_expected.result() if f_expected else None
 
-        if not expected_result["success"]:
+        if not expected_result or not expected_result["success"]:
             print("\n⚠️  Warning: Could not execute expected solution")
             return
 
-        # Compare results
-        comparison = utils.compare_results(
-            user_result["results"],
-            expected_result["results"],
-            user_result["columns"],
-            expected_result["columns"]
-        )
+        # Cheap short-circuit: a different row count can never match, so
+        # skip the deep tuple walk and synthesize the verdict locally.
+        # (Column-only mismatches still go through compare_results so the
+        # "renamed column, same data" diagnostic stays accurate.)
+        if len(user_result["results"]) != len(expected_result["results"]):
+            user_cols = {c.lower() for c in user_result["columns"]}
+            expected_cols = {c.lower() for c in expected_result["columns"]}
+            comparison = {
+                "columns_match": user_cols == expected_cols,
+                "results_match": False,
+                "correct": False,
+                "user_row_count": len(user_result["results"]),
+                "expected_row_count": len(expected_result["results"]),
+                "user_columns": user_result["columns"],
+                "expected_columns": expected_result["columns"]
+            }
+        else:
+            # Compare results, memoizing the verdict on a fingerprint of the
+            # user's output so retrying an equivalent query skips the rescan.
+            # Array/json cells are unhashable; those results just skip the
+            # memo.
+            try:
+                key = (question["id"],
+                       hash((tuple(user_result["columns"]),
+                             tuple(map(tuple, user_result["results"])))))
+            except TypeError:
+                key = None
+            comparison = self._cmp_cache.get(key) if key is not None else None
+            if comparison is None:
+                comparison = utils.compare_results(
+                    user_result["results"],
+                    expected_result["results"],
+                    user_result["columns"],
+                    expected_result["columns"]
+                )
+                if key is not None:
+                    self._cmp_cache[key] = comparison
+                    if len(self._cmp_cache) > 256:
+                        self._cmp_cache.popitem(last=False)
+            else:
+                self._cmp_cache.move_to_end(key)
 
         self.stats["attempted"] += 1
 
@@ -190,6 +350,19 @@ class SQLInterviewApp:
             if show_solution == 'y':
                 self.show_solution(question)
 
+    def _exec_solution(self, question: Dict) -> Dict:
+        """Run a question's solution query, memoized per question id"""
+        qid = question["id"]
+        result = self._solution_cache.get(qid)
+        if result is None:
+            result = utils.run_prepared_query(f"sol_{qid}",
+                                              question["solution"])
+            # Only successes are memoized; a transient outage should not
+            # poison the question for the rest of the session
+            if result["success"]:
+                self._solution_cache[qid] = result
+        return result
+
     def show_solution(self, question: Dict) -> None:
         """Show the solution for a question"""
         print("\n" + "=" * 60)
@@ -199,10 +372,13 @@ class SQLInterviewApp:
         print("\n" + "=" * 60)
 
         # Execute and show results
-        result = utils.run_user_query(question["solution"])
+        result = self._exec_solution(question)
         if result["success"]:
             print("\n📊 Expected Results:")
-            print(utils.format_table(result["results"], result["columns"]))
+            if result["results"]:
+                print(utils.format_table(result["results"], result["columns"]))
+            else:
+                print("(no rows)")
 
     def browse_questions(self) -> None:
         """Browse and select questions"""
@@ -241,7 +417,7 @@ class SQLInterviewApp:
             return
 
         difficulty = difficulty_map[choice]
-        filtered = [q for q in self.questions if q.get("difficulty") == difficulty]
+        filtered = self._by_difficulty.get(difficulty, [])
 
         if not filtered:
             print(f"\n❌ No {difficulty} questions found")
@@ -268,15 +444,14 @@ class SQLInterviewApp:
             print("\n❌ No questions loaded")
             return
 
-        import random
         question = random.choice(self.questions)
         self.practice_question(question)
 
     def show_statistics(self) -> None:
         """Display practice statistics"""
-        print("\n" + "=" * 60)
+        print("\n" + self._BAR)
         print("PRACTICE STATISTICS")
-        print("=" * 60)
+        print(self._BAR)
         print(f"Questions Attempted: {self.stats['attempted']}")
         print(f"Correct: {self.stats['correct']}")
         print(f"Incorrect: {self.stats['incorrect']}")
@@ -289,14 +464,7 @@ class SQLInterviewApp:
 
     def sandbox_mode(self) -> None:
         """SQL Sandbox - Free query mode"""
-        print("\n" + "=" * 60)
-        print("SQL SANDBOX - Free Query Mode")
-        print("=" * 60)
-        print("Execute any SQL query against the database.")
-        print("Type 'BACK' to return to main menu")
-        print("Type 'SCHEMA' to view database schema")
-        print("Type 'CLEAR' to clear the screen")
-        print("=" * 60)
+        print(self._SANDBOX_BANNER)
 
         while True:
             print("\nEnter your SQL query (type 'END' on a new line when done):")
@@ -305,25 +473,32 @@ class SQLInterviewApp:
             # Collect multi-line query
             query_lines = []
             while True:
-                line = input()
-                if line.strip().upper() == 'END':
+                cmd, raw = self._read_block(query_lines)
+                if cmd == 'END':
                     break
-                elif line.strip().upper() == 'BACK':
+                elif cmd == 'BACK':
                     return
-                elif line.strip().upper() == 'SCHEMA':
+                elif cmd == 'SCHEMA':
                     self.view_schema()
                     print("\nEnter your SQL query (type 'END' on a new line when done):")
                     print("-" * 60)
                     continue
-                elif line.strip().upper() == 'CLEAR':
-                    print("\n" * 50)  # Clear screen
+                elif cmd == 'CLEAR':
+                    # ANSI clear + home: one write instead of scrolling
+                    # 50 blank lines through the terminal
+                    if sys.platform == 'win32':
+                        os.system('cls')
+                    else:
+                        sys.stdout.write("\x1b[2J\x1b[H")
+                        sys.stdout.flush()
                     print("=" * 60)
                     print("SQL SANDBOX - Free Query Mode")
                     print("=" * 60)
                     print("\nEnter your SQL query (type 'END' on a new line when done):")
                     print("-" * 60)
                     continue
-                query_lines.append(line)
+                # Other control words are plain text in this context
+                query_lines.append(raw)
 
             user_query = "\n".join(query_lines).strip()
 
@@ -333,7 +508,8 @@ class SQLInterviewApp:
 
             # Execute query
             print("\n⏳ Executing query...")
-            result = utils.run_user_query(user_query)
+            result = utils.run_user_query(user_query,
+                                          limit=self._SANDBOX_LIMIT)
 
             if not result["success"]:
                 print(f"\n❌ Query Error: {result['error']}")
@@ -343,7 +519,11 @@ class SQLInterviewApp:
             print("\n✓ Query executed successfully!")
 
             if result["results"]:
-                print(f"\n📊 Results ({result['row_count']} rows):")
+                if result.get("truncated"):
+                    print(f"\n📊 Results (showing first "
+                          f"{result['row_count']} rows, more available):")
+                else:
+                    print(f"\n📊 Results ({result['row_count']} rows):")
                 print(utils.format_table(result["results"], result["columns"]))
             else:
                 print("\n📊 " + result.get("message", "Query executed successfully (no results returned)"))
@@ -359,71 +539,67 @@ class SQLInterviewApp:
         print("DATABASE SCHEMA")
         print("=" * 60)
 
-        # Query to get all tables
-        tables_query = """
-        SELECT table_name
-        FROM information_schema.tables
-        WHERE table_schema = 'public'
-        AND table_type = 'BASE TABLE'
-        ORDER BY table_name;
+        # One query fetches every column of every public table instead of
+        # one information_schema lookup per table
+        columns_query = """
+        SELECT
+            table_name,
+            column_name,
+            data_type,
+            character_maximum_length,
+            is_nullable,
+            column_default
+        FROM information_schema.columns c
+        WHERE table_schema = %s
+          AND EXISTS (
+            SELECT 1 FROM information_schema.tables t
+            WHERE t.table_schema = c.table_schema
+              AND t.table_name = c.table_name
+              AND t.table_type = 'BASE TABLE')
+        ORDER BY table_name, ordinal_position;
         """
 
-        result = utils.run_user_query(tables_query)
+        result = utils.run_user_query(columns_query, ("public",))
 
         if not result["success"]:
             print(f"\n❌ Error fetching schema: {result['error']}")
             return
 
-        tables = [row[0] for row in result["results"]]
-
-        for table in tables:
-            # Get column information for each table
-            columns_query = f"""
-            SELECT
-                column_name,
-                data_type,
-                character_maximum_length,
-                is_nullable,
-                column_default
-            FROM information_schema.columns
-            WHERE table_name = '{table}'
-            ORDER BY ordinal_position;
-            """
-
-            col_result = utils.run_user_query(columns_query)
-
-            if col_result["success"]:
-                print(f"\n📋 Table: {table}")
-                print("-" * 60)
-
-                for col in col_result["results"]:
-                    col_name = col[0]
-                    data_type = col[1]
-                    max_length = col[2]
-                    nullable = col[3]
-                    default = col[4]
-
-                    type_str = data_type
-                    if max_length:
-                        type_str += f"({max_length})"
-
-                    null_str = "NULL" if nullable == "YES" else "NOT NULL"
-                    default_str = f" DEFAULT {default}" if default else ""
-
-                    print(f"  • {col_name:25} {type_str:20} {null_str}{default_str}")
-
-        # Get row counts
+        tables = []
+        for table, cols in itertools.groupby(result["results"],
+                                             key=lambda r: r[0]):
+            tables.append(table)
+            print(f"\n📋 Table: {table}")
+            print("-" * 60)
+
+            for col in cols:
+                col_name = col[1]
+                data_type = col[2]
+                max_length = col[3]
+                nullable = col[4]
+                default = col[5]
+
+                type_str = data_type
+                if max_length:
+                    type_str += f"({max_length})"
+
+                null_str = "NULL" if nullable == "YES" else "NOT NULL"
+                default_str = f" DEFAULT {default}" if default else ""
+
+                print(f"  • {col_name:25} {type_str:20} {null_str}{default_str}")
+
+        # Get all row counts in a single round-trip
         print("\n" + "=" * 60)
         print("TABLE ROW COUNTS")
         print("=" * 60)
 
-        for table in tables:
-            count_query = f"SELECT COUNT(*) FROM {table};"
-            count_result = utils.run_user_query(count_query)
+        if tables:
+            count_result = utils.run_user_query(
+                utils.build_row_count_query(tables))
 
             if count_result["success"]:
-                count = count_result["results"][0][0]
-                print(f"  {table:30} {count:>10} rows")
+                for table, count in count_result["results"]:
+                    print(f"  {table:30} {count:>10} rows")
 
         print("=" * 60)
 
@@ -440,6 +616,10 @@ class SQLInterviewApp:
         success = utils.setup_database()
 
         if success:
+            # The data changed underneath the memoized expected results
+            # and verdicts; both must be recomputed against fresh tables
+            self._solution_cache.clear()
+            self._cmp_cache.clear()
             print("✅ Database setup completed successfully!")
         else:
             print("❌ Database setup failed. Please check the error messages above.")
@@ -454,6 +634,11 @@ class SQLInterviewApp:
         else:
             print("❌ Database connection failed. Please check your configuration.")
 
+    def _exit(self) -> None:
+        """Exit the application"""
+        print("\n👋 Thank you for practicing! Good luck with your interviews!")
+        sys.exit(0)
+
     def run(self) -> None:
         """Main application loop"""
         print("\n" + "=" * 60)
@@ -468,25 +653,9 @@ class SQLInterviewApp:
             self.display_menu()
             choice = input("\nEnter your choice (1-9): ").strip()
 
-            if choice == "1":
-                self.browse_questions()
-            elif choice == "2":
-                self.practice_by_difficulty()
-            elif choice == "3":
-                self.random_question()
-            elif choice == "4":
-                self.show_statistics()
-            elif choice == "5":
-                self.sandbox_mode()
-            elif choice == "6":
-                self.view_schema()
-            elif choice == "7":
-                self.setup_database()
-            elif choice == "8":
-                self.test_connection()
-            elif choice == "9":
-                print("\n👋 Thank you for practicing! Good luck with your interviews!")
-                sys.exit(0)
+            action = self._actions.get(choice)
+            if action:
+                action()
             else:
                 print("\n❌ Invalid choice. Please enter 1-9.")
 
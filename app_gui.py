@@ -5,11 +5,104 @@ Graphical interface for practicing SQL interview questions
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, font
+from tkinter import ttk, messagebox, font
+import itertools
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from typing import Optional, List, Dict
-import utils
+
+# Imported lazily (see _import_utils) so the DB-driver import cost lands
+# after the first window paint instead of before it
+utils = None
+
+
+def _import_utils():
+    """Bind the utils module on first use"""
+    global utils
+    if utils is None:
+        import utils as _utils
+        utils = _utils
+    return utils
+
+
+# Difficulties map to a small integer code at load time; emoji and color
+# lookups then become branchless tuple indexing (last slot = unknown)
+_DIFF_CODES = {"easy": 0, "medium": 1, "hard": 2}
+_DIFF_EMOJI = ("🟢", "🟡", "🔴", "⚪")
+
+
+def _fmt_row(row, _str=str, _null="NULL"):
+    """Stringify one result row, mapping None to NULL
+
+    The default-argument rebinding keeps str and the NULL literal in
+    locals, avoiding a global lookup per cell in the render hot loop.
+    """
+    return [_null if v is None else _str(v) for v in row]
+
+
+def _make_text_with_scroll(parent, **kw):
+    """Create a tk.Text with a single explicit vertical Scrollbar
+
+    Replaces scrolledtext.ScrolledText, which wires its scrollbar through
+    an extra grid pass per instance; callers pack the returned widget's
+    .frame attribute.
+    """
+    frame = ttk.Frame(parent)
+    scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    text = tk.Text(frame, yscrollcommand=scrollbar.set, **kw)
+    text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scrollbar.config(command=text.yview)
+    text.frame = frame
+    return text
+
+
+class _ChunkedTreeLoader:
+    """Feed rows into a Treeview in viewport-sized chunks on scroll
+
+    Only the first chunk is inserted up front; the yscrollcommand hook
+    appends the next chunk whenever the view nears the end, so render
+    cost tracks the viewport instead of the total result size.
+    """
+
+    CHUNK = 200
+
+    def __init__(self, tree, vbar):
+        self.tree = tree
+        self.vbar = vbar
+        self.rows = []
+        self.rendered = 0
+        # Last configured column tuple, so consecutive queries with the
+        # same shape skip the heading/column reconfiguration entirely
+        self.columns = ()
+        tree.configure(yscrollcommand=self._on_scroll)
+
+    def set_rows(self, rows):
+        """Replace the pending rows and render the first chunk"""
+        self.rows = rows
+        self.rendered = 0
+        self._append_chunk()
+
+    def clear(self):
+        """Forget pending rows (tree children are cleared by the caller)"""
+        self.rows = []
+        self.rendered = 0
+
+    def _append_chunk(self):
+        start = self.rendered
+        chunk = self.rows[start:start + self.CHUNK]
+        insert = self.tree.insert
+        for idx, values in enumerate(chunk, start + 1):
+            insert("", tk.END, text=str(idx), values=values)
+        self.rendered = start + len(chunk)
+
+    def _on_scroll(self, first, last):
+        self.vbar.set(first, last)
+        if float(last) > 0.9 and self.rendered < len(self.rows):
+            self._append_chunk()
 
 
 class SQLInterviewGUI:
@@ -21,12 +114,19 @@ class SQLInterviewGUI:
         self.root.title("SQL Interview Prep")
         self.root.geometry("1400x900")
 
-        # Load environment variables
-        load_dotenv()
-
         # Application state
         self.questions = []
         self.filtered_questions = []
+        self._by_difficulty = {"all": []}
+        self._solution_cache = {}
+        self._solution_lock = threading.Lock()
+        self._solution_window = None
+        self._schema_cache = None
+        self._results_empty = True
+        # Worker pool for DB calls so the Tk event loop never blocks on
+        # query execution; widget updates stay on the main thread
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._filter_after = None
         self.current_question = None
         self.stats = {
             "attempted": 0,
@@ -46,13 +146,30 @@ class SQLInterviewGUI:
             "medium": "#FF9800",
             "hard": "#f44336"
         }
+        # Indexed by the per-question difficulty code from _DIFF_CODES
+        self._diff_colors = (self.colors["easy"], self.colors["medium"],
+                             self.colors["hard"], self.colors["fg"])
 
         # Setup UI
         self.setup_menu()
         self.setup_ui()
-        self.load_questions()
         self.update_stats_display()
 
+        # Environment loading and question ingestion happen after the
+        # first frame is painted so the window appears immediately
+        self.root.after_idle(self._deferred_init)
+
+    def _deferred_init(self):
+        """Finish startup work deferred off the constructor critical path"""
+        # Relaunches within the same environment (and child processes)
+        # inherit the parsed .env values, so skip the filesystem scan
+        # once one process has folded them into os.environ
+        if not os.environ.get("_DOTENV_LOADED"):
+            load_dotenv()
+            os.environ["_DOTENV_LOADED"] = "1"
+        _import_utils()
+        self.load_questions()
+
     def setup_menu(self):
         """Setup menu bar"""
         menubar = tk.Menu(self.root)
@@ -87,10 +204,20 @@ class SQLInterviewGUI:
         self.notebook.add(questions_tab, text="Practice Questions")
         self.setup_questions_tab(questions_tab)
 
-        # Tab 2: SQL Sandbox
-        sandbox_tab = ttk.Frame(self.notebook)
-        self.notebook.add(sandbox_tab, text="SQL Sandbox")
-        self.setup_sandbox_tab(sandbox_tab)
+        # Tab 2: SQL Sandbox — built lazily the first time it is shown,
+        # since its editor, treeview, and scrollbars are dead weight on
+        # startup for users who stay on the practice tab
+        self._sandbox_tab = ttk.Frame(self.notebook)
+        self._sandbox_built = False
+        self.notebook.add(self._sandbox_tab, text="SQL Sandbox")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        """Build the sandbox tab widgets on first visit"""
+        if (not self._sandbox_built
+                and self.notebook.select() == str(self._sandbox_tab)):
+            self._sandbox_built = True
+            self.setup_sandbox_tab(self._sandbox_tab)
 
     def setup_questions_tab(self, parent):
         """Setup questions practice tab"""
@@ -127,18 +254,24 @@ class SQLInterviewGUI:
                 text=text,
                 variable=self.difficulty_var,
                 value=value,
-                command=self.filter_questions
+                command=self._schedule_filter
             ).pack(anchor=tk.W)
 
         # Stats frame
         stats_frame = ttk.LabelFrame(parent, text="Statistics", padding=10)
         stats_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        self.stats_labels = {}
-        for key in ["attempted", "correct", "incorrect", "accuracy"]:
-            label = ttk.Label(stats_frame, text=f"{key.title()}: 0")
-            label.pack(anchor=tk.W)
-            self.stats_labels[key] = label
+        # One multi-line StringVar-backed label: refreshing the stats is
+        # a single variable write instead of four label configs, and Tk
+        # reads the variable directly without marshaling a kwarg dict
+        self.stats_var = tk.StringVar(
+            value="Attempted: 0\nCorrect: 0\nIncorrect: 0\nAccuracy: 0%")
+        self.stats_label = ttk.Label(
+            stats_frame,
+            justify=tk.LEFT,
+            textvariable=self.stats_var
+        )
+        self.stats_label.pack(anchor=tk.W)
 
         # Question list
         list_frame = ttk.LabelFrame(parent, text="Available Questions", padding=5)
@@ -225,14 +358,14 @@ class SQLInterviewGUI:
         editor_frame = ttk.LabelFrame(parent, text="Your SQL Query", padding=10)
         editor_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        self.query_editor = scrolledtext.ScrolledText(
+        self.query_editor = _make_text_with_scroll(
             editor_frame,
             height=10,
             font=("Courier New", 11),
             wrap=tk.WORD,
             undo=True
         )
-        self.query_editor.pack(fill=tk.BOTH, expand=True)
+        self.query_editor.frame.pack(fill=tk.BOTH, expand=True)
 
         # Button frame
         button_frame = ttk.Frame(editor_frame)
@@ -292,42 +425,83 @@ class SQLInterviewGUI:
         v_scrollbar.config(command=self.results_tree.yview)
         h_scrollbar.config(command=self.results_tree.xview)
 
+        self._results_loader = _ChunkedTreeLoader(self.results_tree,
+                                                  v_scrollbar)
+
     def load_questions(self):
         """Load questions from JSON files"""
+        # Ingest in small batches scheduled on the event loop so the first
+        # window paint is not blocked on parsing the whole catalog. Only
+        # the metadata index is kept resident; description, hint, and
+        # solution bodies are fetched on selection (see display_question)
+        self.questions = []
+        self.filtered_questions = self.questions
+        self._by_difficulty = {"all": self.questions}
         try:
-            self.questions = utils.load_questions("all")
-            self.filter_questions()
-            messagebox.showinfo("Success", f"Loaded {len(self.questions)} questions")
+            index = utils.load_question_index("all")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load questions: {str(e)}")
+            return
+        self._ingest_batch(iter(index))
+
+    def _ingest_batch(self, iterator):
+        """Ingest one batch of questions and reschedule until exhausted"""
+        batch = list(itertools.islice(iterator, 32))
+
+        if not batch:
+            self.filter_questions()
+            return
+
+        # The question set is immutable after load: pre-bake the list
+        # display string and the difficulty buckets once instead of
+        # rebuilding them on every filter toggle
+        items = []
+        for q in batch:
+            difficulty = q.get("difficulty", "")
+            code = _DIFF_CODES.get(difficulty, 3)
+            q["_diff_code"] = code
+            q["_display"] = f"{_DIFF_EMOJI[code]} {q['id']}. {q['title']}"
+            q["_difficulty_upper"] = q.get("difficulty", "N/A").upper()
+            q["_difficulty_color"] = self._diff_colors[code]
+            q["_topics_str"] = ", ".join(q.get("topics", []))
+            self._by_difficulty.setdefault(difficulty, []).append(q)
+            items.append(q["_display"])
+        self.questions.extend(batch)
+
+        # Show progress immediately while the default "all" filter is up
+        if self.difficulty_var.get() == "all":
+            self.question_listbox.insert(tk.END, *items)
+
+        self.root.after_idle(self._ingest_batch, iterator)
+
+    def _schedule_filter(self):
+        """Debounce filter clicks so rapid toggles rebuild the list once"""
+        if self._filter_after is not None:
+            self.root.after_cancel(self._filter_after)
+        self._filter_after = self.root.after(50, self._run_filter)
+
+    def _run_filter(self):
+        """Run the debounced filter rebuild"""
+        self._filter_after = None
+        self.filter_questions()
 
     def filter_questions(self):
         """Filter questions by difficulty"""
         difficulty = self.difficulty_var.get()
-
-        if difficulty == "all":
-            self.filtered_questions = self.questions
-        else:
-            self.filtered_questions = [
-                q for q in self.questions
-                if q.get("difficulty") == difficulty
-            ]
-
+        self.filtered_questions = self._by_difficulty.get(difficulty, [])
         self.update_question_list()
 
     def update_question_list(self):
         """Update question listbox"""
-        self.question_listbox.delete(0, tk.END)
+        if self.question_listbox.size():
+            self.question_listbox.delete(0, tk.END)
 
-        for q in self.filtered_questions:
-            difficulty_emoji = {
-                "easy": "🟢",
-                "medium": "🟡",
-                "hard": "🔴"
-            }.get(q.get("difficulty", ""), "⚪")
+        items = [q["_display"] for q in self.filtered_questions]
 
-            text = f"{difficulty_emoji} {q['id']}. {q['title']}"
-            self.question_listbox.insert(tk.END, text)
+        # One variadic insert is a single Tcl round-trip instead of one
+        # Python->Tcl call per row
+        if items:
+            self.question_listbox.insert(tk.END, *items)
 
     def on_question_select(self, event):
         """Handle question selection"""
@@ -347,19 +521,33 @@ class SQLInterviewGUI:
 
         q = self.current_question
 
+        # Hydrate the body fields on first view; the index keeps only
+        # metadata resident
+        if "solution" not in q:
+            try:
+                q.update(utils.load_question_body(q["id"]))
+            except Exception as e:
+                messagebox.showerror(
+                    "Error", f"Failed to load question: {str(e)}")
+                return
+
+        # Prefetch the expected result while the user reads the question,
+        # so validation is usually free by the time they click Run Query
+        if q["id"] not in self._solution_cache:
+            self._executor.submit(self._prefetch_expected,
+                                  q["id"], q["solution"])
+
         # Update title
         self.question_title.config(text=f"Question #{q['id']}: {q['title']}")
 
-        # Update difficulty
-        difficulty = q.get('difficulty', 'N/A').upper()
-        difficulty_color = self.colors.get(q.get('difficulty', ''), self.colors['fg'])
+        # Update difficulty (precomputed at load time)
         self.question_difficulty.config(
-            text=f"Difficulty: {difficulty}",
-            foreground=difficulty_color
+            text=f"Difficulty: {q['_difficulty_upper']}",
+            foreground=q["_difficulty_color"]
         )
 
         # Update topics
-        topics = ", ".join(q.get('topics', []))
+        topics = q["_topics_str"]
         self.question_topics.config(text=f"Topics: {topics}" if topics else "")
 
         # Update description
@@ -390,9 +578,26 @@ class SQLInterviewGUI:
     def clear_results(self):
         """Clear results display"""
         self.results_status.config(text="")
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        self.results_tree["columns"] = ()
+        # Skip the Tcl round-trips entirely when nothing is displayed
+        if self._results_empty:
+            return
+        # Only rows are cleared; the column layout is left in place so a
+        # follow-up query with the same shape skips reconfiguration
+        children = self.results_tree.get_children()
+        if children:
+            self.results_tree.delete(*children)
+        self._results_loader.clear()
+        self._results_empty = True
+
+    def _prefetch_expected(self, qid, solution):
+        """Run the solution query on a worker and cache its result"""
+        with self._solution_lock:
+            if qid in self._solution_cache:
+                return
+        result = utils.run_user_query(solution)
+        if result["success"]:
+            with self._solution_lock:
+                self._solution_cache.setdefault(qid, result)
 
     def run_query(self):
         """Execute user's query"""
@@ -406,12 +611,35 @@ class SQLInterviewGUI:
             messagebox.showwarning("Warning", "Please enter a SQL query")
             return
 
-        # Execute user's query
+        # Execute user's query (and, when not cached yet, the expected
+        # solution) on worker threads; poll from the event loop so the
+        # GUI stays responsive during slow queries
+        # update_idletasks flushes just the pending redraws; a full
+        # update() would also pump queued input events
         self.results_status.config(text="⏳ Executing query...", foreground=self.colors['warning'])
-        self.root.update()
+        self.results_status.update_idletasks()
 
-        user_result = utils.run_user_query(user_query)
+        q = self.current_question
+        fut_user = self._executor.submit(utils.run_user_query, user_query)
+        # With the prefetched expected result in cache, comparison happens
+        # locally; otherwise validation is pushed down to the server so
+        # only the EXCEPT/COUNT counters cross the wire
+        fut_validate = None
+        if q["id"] not in self._solution_cache:
+            fut_validate = self._executor.submit(utils.validate_against,
+                                                 user_query, q["solution"])
+        self._poll_query(q, fut_user, fut_validate)
+
+    def _poll_query(self, q, fut_user, fut_validate):
+        """Poll pending query futures from the Tk event loop"""
+        if not fut_user.done() or (fut_validate and not fut_validate.done()):
+            self.root.after(50, self._poll_query, q, fut_user, fut_validate)
+            return
+        self._on_query_done(q, fut_user.result(),
+                            fut_validate.result() if fut_validate else None)
 
+    def _on_query_done(self, q, user_result, validation):
+        """Apply finished query results (runs on the main thread)"""
         if not user_result["success"]:
             self.results_status.config(
                 text=f"❌ Query Error",
@@ -426,23 +654,68 @@ class SQLInterviewGUI:
         # Display user results
         self.display_results(user_result["results"], user_result["columns"])
 
-        # Execute expected query
-        expected_result = utils.run_user_query(self.current_question["solution"])
-
-        if not expected_result["success"]:
+        if validation is not None:
+            # Server-side harness already produced the verdict
+            if not validation["success"]:
+                self.results_status.config(
+                    text="⚠️ Could not validate results",
+                    foreground=self.colors['warning']
+                )
+                return
+            comparison = validation
+        elif (expected_result := self._solution_cache.get(q["id"])) is None \
+                or not expected_result["success"]:
             self.results_status.config(
                 text="⚠️ Could not validate results",
                 foreground=self.colors['warning']
             )
             return
-
-        # Compare results
-        comparison = utils.compare_results(
-            user_result["results"],
-            expected_result["results"],
-            user_result["columns"],
-            expected_result["columns"]
-        )
+        # Compare locally against the cached expected result; when the
+        # column sets already differ the answer cannot be correct, so
+        # skip the full row-by-row comparison
+        elif ({c.lower() for c in user_result["columns"]}
+                != {c.lower() for c in expected_result["columns"]}):
+            comparison = {
+                "columns_match": False,
+                "results_match": False,
+                "correct": False,
+                "user_row_count": len(user_result["results"]),
+                "expected_row_count": len(expected_result["results"]),
+                "user_columns": user_result["columns"],
+                "expected_columns": expected_result["columns"]
+            }
+        else:
+            # Hashed row-set fast path: normalizing first keeps type-level
+            # differences (Decimal vs float, date vs string) from skewing
+            # the signatures, so a signature mismatch proves the row sets
+            # differ in O(N) without the sort-based comparator. Signature
+            # equality still defers to the authoritative comparison.
+            try:
+                user_sig = hash(frozenset(
+                    map(utils.normalize_row, user_result["results"])))
+                expected_sig = hash(frozenset(
+                    map(utils.normalize_row, expected_result["results"])))
+            except TypeError:
+                # A cell normalization missed (unhashable type); let the
+                # full comparator decide
+                user_sig = expected_sig = None
+            if user_sig is not None and user_sig != expected_sig:
+                comparison = {
+                    "columns_match": True,
+                    "results_match": False,
+                    "correct": False,
+                    "user_row_count": len(user_result["results"]),
+                    "expected_row_count": len(expected_result["results"]),
+                    "user_columns": user_result["columns"],
+                    "expected_columns": expected_result["columns"]
+                }
+            else:
+                comparison = utils.compare_results(
+                    user_result["results"],
+                    expected_result["results"],
+                    user_result["columns"],
+                    expected_result["columns"]
+                )
 
         self.stats["attempted"] += 1
 
@@ -464,8 +737,8 @@ class SQLInterviewGUI:
 
             if not comparison["columns_match"]:
                 error_msg += f"Column mismatch:\n"
-                error_msg += f"Your columns: {user_result['columns']}\n"
-                error_msg += f"Expected: {expected_result['columns']}\n\n"
+                error_msg += f"Your columns: {comparison['user_columns']}\n"
+                error_msg += f"Expected: {comparison['expected_columns']}\n\n"
 
             if not comparison["results_match"]:
                 error_msg += f"Data mismatch:\n"
@@ -487,111 +760,175 @@ class SQLInterviewGUI:
             )
             return
 
-        # Configure columns
-        self.results_tree["columns"] = columns
-        self.results_tree.heading("#0", text="Row")
+        # Populate with the tree detached so Tk skips per-row redraw and
+        # layout work
+        pack_info = self.results_tree.pack_info()
+        self.results_tree.pack_forget()
+        try:
+            self._populate_tree(self._results_loader, results, columns)
+        finally:
+            self.results_tree.pack(**pack_info)
+        self._results_empty = False
+
+    def _populate_tree(self, loader, results, columns):
+        """Configure columns and hand rows to the tree's chunked loader"""
+        tree = loader.tree
+        cols = tuple(columns)
+        if cols != loader.columns:
+            tree["columns"] = columns
+            tree.heading("#0", text="Row")
+
+            # Local bindings skip the attribute lookup per column, which
+            # adds up for wide result sets
+            heading = tree.heading
+            column = tree.column
+            for col in columns:
+                heading(col, text=col)
+                column(col, width=150)
+            loader.columns = cols
+
+        # Pre-build the formatted rows in one pass; map drives the
+        # per-row loop in C, and the loader renders the result
+        # viewport-sized chunk by chunk
+        loader.set_rows(list(map(_fmt_row, results)))
+
+    def _build_results_tree(self, parent):
+        """Create a scrollable results treeview inside parent
+
+        Returns the treeview and its vertical scrollbar.
+        """
+        table_frame = ttk.Frame(parent)
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        for col in columns:
-            self.results_tree.heading(col, text=col)
-            self.results_tree.column(col, width=150)
+        v_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL)
+        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Add rows
-        for idx, row in enumerate(results, 1):
-            values = [str(val) if val is not None else "NULL" for val in row]
-            self.results_tree.insert("", tk.END, text=str(idx), values=values)
+        h_scrollbar = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL)
+        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
 
-    def show_solution(self):
-        """Show solution for current question"""
-        if not self.current_question:
-            messagebox.showwarning("Warning", "Please select a question first")
-            return
+        tree = ttk.Treeview(
+            table_frame,
+            yscrollcommand=v_scrollbar.set,
+            xscrollcommand=h_scrollbar.set,
+            show="tree headings"
+        )
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        solution = self.current_question.get('solution', 'No solution available')
+        v_scrollbar.config(command=tree.yview)
+        h_scrollbar.config(command=tree.xview)
+
+        return tree, v_scrollbar
 
-        # Create solution window
-        solution_window = tk.Toplevel(self.root)
-        solution_window.title(f"Solution - Question #{self.current_question['id']}")
-        solution_window.geometry("800x600")
+    def _build_solution_window(self):
+        """Create the solution window once; later calls reuse its widgets"""
+        window = tk.Toplevel(self.root)
+        window.geometry("800x600")
+        # Hide instead of destroy so the widgets survive for reuse
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
 
         # Solution text
         ttk.Label(
-            solution_window,
+            window,
             text="Solution",
             font=("Arial", 14, "bold")
         ).pack(pady=10)
 
-        solution_text = scrolledtext.ScrolledText(
-            solution_window,
+        self._solution_text = _make_text_with_scroll(
+            window,
             height=10,
             font=("Courier New", 11),
             wrap=tk.WORD
         )
-        solution_text.pack(fill=tk.BOTH, expand=False, padx=10, pady=5)
-        solution_text.insert(1.0, solution)
-        solution_text.config(state=tk.DISABLED)
+        self._solution_text.frame.pack(fill=tk.BOTH, expand=False,
+                                       padx=10, pady=5)
 
-        # Execute and show results
+        # Expected results table (populated per invocation)
         ttk.Label(
-            solution_window,
+            window,
             text="Expected Results",
             font=("Arial", 14, "bold")
         ).pack(pady=10)
 
-        result = utils.run_user_query(solution)
+        self._solution_tree, vbar = self._build_results_tree(window)
+        self._solution_loader = _ChunkedTreeLoader(self._solution_tree, vbar)
 
-        if result["success"]:
-            # Results table
-            table_frame = ttk.Frame(solution_window)
-            table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-
-            v_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL)
-            v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-            h_scrollbar = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL)
-            h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
-
-            results_tree = ttk.Treeview(
-                table_frame,
-                yscrollcommand=v_scrollbar.set,
-                xscrollcommand=h_scrollbar.set,
-                show="tree headings"
-            )
-            results_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Close button
+        ttk.Button(
+            window,
+            text="Close",
+            command=window.withdraw
+        ).pack(pady=10)
 
-            v_scrollbar.config(command=results_tree.yview)
-            h_scrollbar.config(command=results_tree.xview)
+        return window
 
-            # Configure columns
-            results_tree["columns"] = result["columns"]
-            results_tree.heading("#0", text="Row")
+    def show_solution(self):
+        """Show solution for current question"""
+        if not self.current_question:
+            messagebox.showwarning("Warning", "Please select a question first")
+            return
 
-            for col in result["columns"]:
-                results_tree.heading(col, text=col)
-                results_tree.column(col, width=150)
+        solution = self.current_question.get('solution', 'No solution available')
 
-            # Add rows
-            for idx, row in enumerate(result["results"], 1):
-                values = [str(val) if val is not None else "NULL" for val in row]
-                results_tree.insert("", tk.END, text=str(idx), values=values)
+        # Widget creation is the dominant cost here, so the window is
+        # built once and reused; each call just swaps text and rows
+        if (self._solution_window is None
+                or not self._solution_window.winfo_exists()):
+            self._solution_window = self._build_solution_window()
+        window = self._solution_window
+        window.title(f"Solution - Question #{self.current_question['id']}")
+
+        self._solution_text.config(state=tk.NORMAL)
+        self._solution_text.delete(1.0, tk.END)
+        self._solution_text.insert(1.0, solution)
+        self._solution_text.config(state=tk.DISABLED)
+
+        tree = self._solution_tree
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        self._solution_loader.clear()
+
+        # Show the window immediately; the expected results fill in from
+        # the prefetch cache when available, else once the worker thread
+        # finishes the query
+        window.deiconify()
+        window.lift()
+
+        cached = self._solution_cache.get(self.current_question["id"])
+        if cached is not None:
+            self._populate_tree(self._solution_loader,
+                                cached["results"], cached["columns"])
+        else:
+            fut = self._executor.submit(utils.run_user_query, solution)
+            self._poll_solution(fut)
 
-        # Close button
-        ttk.Button(
-            solution_window,
-            text="Close",
-            command=solution_window.destroy
-        ).pack(pady=10)
+    def _poll_solution(self, fut):
+        """Poll the pending solution-results future from the event loop"""
+        if not fut.done():
+            self.root.after(50, self._poll_solution, fut)
+            return
+        result = fut.result()
+        if result["success"]:
+            self._populate_tree(self._solution_loader,
+                                result["results"], result["columns"])
 
     def update_stats_display(self):
         """Update statistics display"""
-        self.stats_labels["attempted"].config(text=f"Attempted: {self.stats['attempted']}")
-        self.stats_labels["correct"].config(text=f"Correct: {self.stats['correct']}")
-        self.stats_labels["incorrect"].config(text=f"Incorrect: {self.stats['incorrect']}")
-
         if self.stats["attempted"] > 0:
             accuracy = (self.stats["correct"] / self.stats["attempted"]) * 100
-            self.stats_labels["accuracy"].config(text=f"Accuracy: {accuracy:.1f}%")
+            accuracy_text = f"Accuracy: {accuracy:.1f}%"
         else:
-            self.stats_labels["accuracy"].config(text="Accuracy: 0%")
+            accuracy_text = "Accuracy: 0%"
+
+        text = (
+            f"Attempted: {self.stats['attempted']}\n"
+            f"Correct: {self.stats['correct']}\n"
+            f"Incorrect: {self.stats['incorrect']}\n"
+            f"{accuracy_text}"
+        )
+        # Skip the Tcl write entirely when nothing changed
+        if text != self.stats_var.get():
+            self.stats_var.set(text)
 
     def setup_database(self):
         """Setup database with sample data"""
@@ -606,6 +943,10 @@ class SQLInterviewGUI:
         try:
             success = utils.setup_database()
             if success:
+                # Cached expected results and the schema snapshot describe
+                # the old data; drop them
+                self._solution_cache.clear()
+                self._schema_cache = None
                 messagebox.showinfo("Success", "Database setup completed successfully!")
             else:
                 messagebox.showerror("Error", "Database setup failed. Check console for details.")
@@ -664,7 +1005,7 @@ class SQLInterviewGUI:
         ttk.Label(button_frame, text="Sample Queries:").pack(side=tk.LEFT, padx=(20, 5))
 
         self.sample_query_var = tk.StringVar()
-        sample_queries = {
+        self.sample_queries = {
             "Select all employees": "SELECT * FROM employees LIMIT 10;",
             "Count by department": "SELECT d.name, COUNT(e.id) AS emp_count\nFROM departments d\nLEFT JOIN employees e ON d.id = e.department_id\nGROUP BY d.id, d.name;",
             "Top selling products": "SELECT p.name, SUM(o.quantity * p.price) AS revenue\nFROM products p\nJOIN orders o ON p.product_id = o.product_id\nGROUP BY p.product_id, p.name\nORDER BY revenue DESC\nLIMIT 5;",
@@ -674,32 +1015,25 @@ class SQLInterviewGUI:
         sample_combo = ttk.Combobox(
             button_frame,
             textvariable=self.sample_query_var,
-            values=list(sample_queries.keys()),
+            values=list(self.sample_queries.keys()),
             state="readonly",
             width=30
         )
         sample_combo.pack(side=tk.LEFT, padx=5)
-
-        def load_sample_query(event):
-            query_name = self.sample_query_var.get()
-            if query_name in sample_queries:
-                self.sandbox_editor.delete(1.0, tk.END)
-                self.sandbox_editor.insert(1.0, sample_queries[query_name])
-
-        sample_combo.bind('<<ComboboxSelected>>', load_sample_query)
+        sample_combo.bind('<<ComboboxSelected>>', self.load_sample_query)
 
         # Query editor frame
         editor_frame = ttk.LabelFrame(container, text="SQL Query Editor", padding=10)
         editor_frame.pack(fill=tk.BOTH, expand=True, pady=10)
 
-        self.sandbox_editor = scrolledtext.ScrolledText(
+        self.sandbox_editor = _make_text_with_scroll(
             editor_frame,
             height=15,
             font=("Courier New", 11),
             wrap=tk.WORD,
             undo=True
         )
-        self.sandbox_editor.pack(fill=tk.BOTH, expand=True)
+        self.sandbox_editor.frame.pack(fill=tk.BOTH, expand=True)
 
         # Execute button
         execute_frame = ttk.Frame(editor_frame)
@@ -718,6 +1052,13 @@ class SQLInterviewGUI:
         )
         self.sandbox_status.pack(side=tk.LEFT, padx=10)
 
+        # Shown only when a result was truncated at the fetch cap
+        self.sandbox_more_button = ttk.Button(
+            execute_frame,
+            text="Load More",
+            command=self.load_more_sandbox_rows
+        )
+
         # Results frame
         results_frame = ttk.LabelFrame(container, text="Query Results", padding=10)
         results_frame.pack(fill=tk.BOTH, expand=True, pady=5)
@@ -746,15 +1087,35 @@ class SQLInterviewGUI:
         v_scrollbar.config(command=self.sandbox_results_tree.yview)
         h_scrollbar.config(command=self.sandbox_results_tree.xview)
 
+        self._sandbox_loader = _ChunkedTreeLoader(self.sandbox_results_tree,
+                                                  v_scrollbar)
+
     def clear_sandbox_query(self):
         """Clear sandbox query editor"""
         self.sandbox_editor.delete(1.0, tk.END)
         self.sandbox_status.config(text="")
-        for item in self.sandbox_results_tree.get_children():
-            self.sandbox_results_tree.delete(item)
-        self.sandbox_results_tree["columns"] = ()
-
-    def execute_sandbox_query(self):
+        # Forget the loader's pending rows too, or the next scroll event
+        # would re-append the cleared chunks; the column layout stays in
+        # place so the loader's shape memo remains accurate
+        children = self.sandbox_results_tree.get_children()
+        if children:
+            self.sandbox_results_tree.delete(*children)
+        self._sandbox_loader.clear()
+
+    def load_sample_query(self, event):
+        """Load the selected sample query into the sandbox editor"""
+        query = self.sample_queries.get(self.sample_query_var.get())
+        if query is not None:
+            # One replace call swaps the content in a single Tk round
+            # trip, and the separator keeps it one undo unit
+            self.sandbox_editor.edit_separator()
+            self.sandbox_editor.replace("1.0", tk.END, query)
+
+    # Rows fetched per sandbox query; results beyond the cap stay on the
+    # server until the user asks for more
+    _SANDBOX_LIMIT = 1000
+
+    def execute_sandbox_query(self, limit=None):
         """Execute query in sandbox"""
         query = self.sandbox_editor.get(1.0, tk.END).strip()
 
@@ -762,49 +1123,75 @@ class SQLInterviewGUI:
             messagebox.showwarning("Warning", "Please enter a SQL query")
             return
 
-        # Execute query
+        # Execute on a worker thread; poll from the event loop so the GUI
+        # stays responsive during slow queries (same pattern as run_query)
         self.sandbox_status.config(text="⏳ Executing...", foreground=self.colors['warning'])
-        self.root.update()
+        self.sandbox_status.update_idletasks()
+
+        self._sandbox_limit = limit or self._SANDBOX_LIMIT
+        fut = self._executor.submit(utils.run_user_query, query,
+                                    limit=self._sandbox_limit)
+        self._poll_sandbox(fut)
 
-        result = utils.run_user_query(query)
+    def load_more_sandbox_rows(self):
+        """Re-run the sandbox query with a doubled fetch cap"""
+        self.execute_sandbox_query(limit=self._sandbox_limit * 2)
 
+    def _poll_sandbox(self, fut):
+        """Poll the pending sandbox future from the Tk event loop"""
+        if not fut.done():
+            self.root.after(50, self._poll_sandbox, fut)
+            return
+        self._on_sandbox_done(fut.result())
+
+    def _on_sandbox_done(self, result):
+        """Apply finished sandbox results (runs on the main thread)"""
         # Clear previous results
-        for item in self.sandbox_results_tree.get_children():
-            self.sandbox_results_tree.delete(item)
-        self.sandbox_results_tree["columns"] = ()
+        children = self.sandbox_results_tree.get_children()
+        if children:
+            self.sandbox_results_tree.delete(*children)
+        self._sandbox_loader.clear()
 
         if not result["success"]:
             self.sandbox_status.config(
                 text=f"❌ Error",
                 foreground=self.colors['error']
             )
+            self.sandbox_more_button.pack_forget()
             messagebox.showerror("Query Error", result['error'])
             return
 
         # Display results
         if result["results"]:
-            self.sandbox_status.config(
-                text=f"✅ Success - {result['row_count']} rows",
-                foreground=self.colors['success']
-            )
-
-            # Configure columns
-            self.sandbox_results_tree["columns"] = result["columns"]
-            self.sandbox_results_tree.heading("#0", text="Row")
-
-            for col in result["columns"]:
-                self.sandbox_results_tree.heading(col, text=col)
-                self.sandbox_results_tree.column(col, width=150)
-
-            # Add rows
-            for idx, row in enumerate(result["results"], 1):
-                values = [str(val) if val is not None else "NULL" for val in row]
-                self.sandbox_results_tree.insert("", tk.END, text=str(idx), values=values)
+            if result.get("truncated"):
+                self.sandbox_status.config(
+                    text=f"✅ Showing first {result['row_count']} rows"
+                         " (more available)",
+                    foreground=self.colors['success']
+                )
+                self.sandbox_more_button.pack(side=tk.LEFT, padx=5)
+            else:
+                self.sandbox_status.config(
+                    text=f"✅ Success - {result['row_count']} rows",
+                    foreground=self.colors['success']
+                )
+                self.sandbox_more_button.pack_forget()
+            # Populate with the tree detached so Tk skips per-row redraw
+            # and layout work, as display_results does
+            tree = self.sandbox_results_tree
+            pack_info = tree.pack_info()
+            tree.pack_forget()
+            try:
+                self._populate_tree(self._sandbox_loader,
+                                    result["results"], result["columns"])
+            finally:
+                tree.pack(**pack_info)
         else:
             self.sandbox_status.config(
                 text="✅ Query executed (no results)",
                 foreground=self.colors['success']
             )
+            self.sandbox_more_button.pack_forget()
 
     def show_schema(self):
         """Show database schema in a new window"""
@@ -820,12 +1207,12 @@ class SQLInterviewGUI:
         ).pack(pady=10)
 
         # Create scrolled text for schema
-        schema_text = scrolledtext.ScrolledText(
+        schema_text = _make_text_with_scroll(
             schema_window,
             font=("Courier New", 10),
             wrap=tk.WORD
         )
-        schema_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        schema_text.frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Get schema information
         schema_info = self.get_schema_info()
@@ -839,77 +1226,92 @@ class SQLInterviewGUI:
             command=schema_window.destroy
         ).pack(pady=10)
 
+    # Seconds before a cached schema snapshot is refreshed in the background
+    _SCHEMA_TTL = 60
+
     def get_schema_info(self):
-        """Get database schema information as formatted text"""
+        """Get database schema information as formatted text
+
+        The rendered schema is cached; once stale, the cached copy is
+        served immediately while a background refresh replaces it
+        (stale-while-revalidate), so the Schema window never waits on
+        the catalog queries twice.
+        """
+        cached = self._schema_cache
+        if cached is not None:
+            ts, text = cached
+            if time.time() - ts >= self._SCHEMA_TTL:
+                self._executor.submit(self._refresh_schema)
+            return text
+        return self._refresh_schema()
+
+    def _refresh_schema(self):
+        """Rebuild the schema snapshot and refresh the cache"""
+        text = self._build_schema_info()
+        self._schema_cache = (time.time(), text)
+        return text
+
+    # Every table with its columns, aggregated server-side into a single
+    # JSON value, so one round trip replaces the per-table column pass
+    _SCHEMA_QUERY = """
+    SELECT json_agg(json_build_object(
+        'table', t.table_name,
+        'columns', (
+            SELECT json_agg(json_build_object(
+                'name', c.column_name,
+                'type', c.data_type,
+                'max_len', c.character_maximum_length,
+                'nullable', c.is_nullable,
+                'default', c.column_default) ORDER BY c.ordinal_position)
+            FROM information_schema.columns c
+            WHERE c.table_schema = t.table_schema
+              AND c.table_name = t.table_name)
+    ) ORDER BY t.table_name)
+    FROM information_schema.tables t
+    WHERE t.table_schema = %s AND t.table_type = 'BASE TABLE';
+    """
+
+    def _build_schema_info(self):
+        """Render the schema as formatted text in two round trips"""
+        result = utils.run_user_query(self._SCHEMA_QUERY, ("public",))
+
+        if not result["success"]:
+            return f"Error fetching schema: {result['error']}"
+
+        tables = result["results"][0][0] or []
+
         output = []
         output.append("=" * 80)
         output.append("DATABASE SCHEMA")
         output.append("=" * 80)
 
-        # Query to get all tables
-        tables_query = """
-        SELECT table_name
-        FROM information_schema.tables
-        WHERE table_schema = 'public'
-        AND table_type = 'BASE TABLE'
-        ORDER BY table_name;
-        """
+        for table in tables:
+            output.append(f"\n📋 Table: {table['table'].upper()}")
+            output.append("-" * 80)
 
-        result = utils.run_user_query(tables_query)
+            for col in table["columns"] or []:
+                type_str = col["type"]
+                if col["max_len"]:
+                    type_str += f"({col['max_len']})"
 
-        if not result["success"]:
-            return f"Error fetching schema: {result['error']}"
+                null_str = "NULL" if col["nullable"] == "YES" else "NOT NULL"
+                default_str = f" DEFAULT {col['default']}" if col["default"] else ""
 
-        tables = [row[0] for row in result["results"]]
+                output.append(f"  • {col['name']:30} {type_str:20} {null_str}{default_str}")
 
-        for table in tables:
-            # Get column information for each table
-            columns_query = f"""
-            SELECT
-                column_name,
-                data_type,
-                character_maximum_length,
-                is_nullable,
-                column_default
-            FROM information_schema.columns
-            WHERE table_name = '{table}'
-            ORDER BY ordinal_position;
-            """
-
-            col_result = utils.run_user_query(columns_query)
-
-            if col_result["success"]:
-                output.append(f"\n📋 Table: {table.upper()}")
-                output.append("-" * 80)
-
-                for col in col_result["results"]:
-                    col_name = col[0]
-                    data_type = col[1]
-                    max_length = col[2]
-                    nullable = col[3]
-                    default = col[4]
-
-                    type_str = data_type
-                    if max_length:
-                        type_str += f"({max_length})"
-
-                    null_str = "NULL" if nullable == "YES" else "NOT NULL"
-                    default_str = f" DEFAULT {default}" if default else ""
-
-                    output.append(f"  • {col_name:30} {type_str:20} {null_str}{default_str}")
-
-        # Get row counts
+        # Exact row counts in one UNION ALL round trip; the counts are
+        # shown to users as authoritative, so no planner estimates here
         output.append("\n" + "=" * 80)
         output.append("TABLE ROW COUNTS")
         output.append("=" * 80)
 
-        for table in tables:
-            count_query = f"SELECT COUNT(*) FROM {table};"
-            count_result = utils.run_user_query(count_query)
+        if tables:
+            count_result = utils.run_user_query(
+                utils.build_row_count_query([t["table"] for t in tables]))
 
             if count_result["success"]:
-                count = count_result["results"][0][0]
-                output.append(f"  {table:35} {count:>10} rows")
+                for table, count in count_result["results"]:
+                    output.append(f"  {table:35} {count:>10} rows")
 
         output.append("=" * 80)
 
@@ -935,8 +1337,22 @@ Created for SQL interview preparation.
         messagebox.showinfo("About", about_text)
 
 
+def _prefetch_catalog():
+    """Warm the utils import and question catalog off the main thread"""
+    _import_utils()
+    utils.load_questions("all")
+
+
 def main():
     """Main entry point"""
+    # Warm the question catalog while Tk builds the window, so the
+    # deferred first load finds the parsed JSON already cached. The
+    # utils import (and psycopg2 behind it) stays off the main thread
+    # so first paint is not blocked either. Worst case the two loads
+    # race and parse twice; the caches are idempotent either way.
+    prefetch = threading.Thread(target=_prefetch_catalog, daemon=True)
+    prefetch.start()
+
     root = tk.Tk()
     app = SQLInterviewGUI(root)
     root.mainloop()
@@ -3,52 +3,201 @@ Utility functions for SQL Interview Prep App
 Handles database connections, query execution, and result comparison
 """
 
+import atexit
+import functools
+import itertools
+from collections import Counter
 import os
 import json
+import pickle
+import re
+import threading
 import psycopg2
 from psycopg2 import sql, Error
+from psycopg2 import errors as pg_errors
+from psycopg2 import pool as pg_pool
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from typing import List, Dict, Tuple, Any, Optional
 from datetime import datetime, date
 from decimal import Decimal
 
+# orjson decodes the question catalog several times faster than the
+# stdlib parser; it is optional and the stdlib is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_QUESTION_FILES = {
+    "easy": "data/easy_questions.json",
+    "medium": "data/medium_questions.json",
+    "hard": "data/hard_questions.json",
+}
+
+
+# Decoded question files keyed by path -> (mtime_ns, questions), so a
+# repeat call is one stat plus a dict hit while an edited file is still
+# picked up on the next read
+_QCACHE: Dict[str, Tuple[int, tuple]] = {}
+
+
+def _parse_question_file(path: str) -> tuple:
+    """Parse one question JSON file, memoized on the file's mtime"""
+    try:
+        key = os.stat(path).st_mtime_ns
+    except OSError:
+        print(f"Warning: {os.path.basename(path)} not found")
+        return ()
+
+    cached = _QCACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    # Cold process: prefer the pickled sidecar, regenerated whenever
+    # the JSON source is newer, so warm starts skip the JSON parse
+    sidecar = path + ".pkl"
+    try:
+        if os.stat(sidecar).st_mtime_ns >= key:
+            with open(sidecar, "rb") as f:
+                data = pickle.load(f)
+            _QCACHE[path] = (key, data)
+            return data
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = tuple(orjson.loads(raw) if orjson is not None
+                 else json.loads(raw))
+    _QCACHE[path] = (key, data)
+
+    try:
+        tmp = sidecar + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, sidecar)
+    except OSError:
+        # A read-only data dir just means the next start parses again
+        pass
+    return data
+
+
+# Parsed catalog persisted next to the JSON sources so warm starts do a
+# single read + unpickle instead of parsing every question file
+_INDEX_PICKLE = "data/questions_index.pkl"
+_INDEX_CACHE: Optional[Dict[str, List[Dict]]] = None
+
+
+def _read_index_pickle() -> Optional[Dict[str, List[Dict]]]:
+    """Load the persisted catalog if no JSON source is newer than it"""
+    try:
+        pickle_mtime = os.path.getmtime(_INDEX_PICKLE)
+        if any(os.path.getmtime(path) > pickle_mtime
+               for path in _QUESTION_FILES.values()
+               if os.path.exists(path)):
+            return None
+        with open(_INDEX_PICKLE, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _write_index_pickle(catalog: Dict[str, List[Dict]]) -> None:
+    """Persist the parsed catalog atomically; failure is non-fatal"""
+    try:
+        tmp_path = _INDEX_PICKLE + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _INDEX_PICKLE)
+    except OSError:
+        pass
+
+
+def _warn_invalid_questions(catalog: Dict[str, List[Dict]]) -> None:
+    """Emit one aggregated warning for malformed questions, if any"""
+    bad = []
+    for chunk in catalog.values():
+        for question in chunk:
+            valid, missing = validate_question(question)
+            if not valid:
+                bad.append(f"{question.get('id', '?')}: "
+                           f"{', '.join(sorted(missing))}")
+    if bad:
+        print(f"Warning: {len(bad)} question(s) missing required fields "
+              f"({'; '.join(bad)})")
+
 
 def load_questions(difficulty: str = "all") -> List[Dict]:
     """
     Load questions from JSON files
 
+    The parsed catalog is cached in memory for the process and mirrored
+    to a pickle on disk, which later cold starts load in one read when
+    none of the JSON sources changed.
+
     Args:
         difficulty: "easy", "medium", "hard", or "all"
 
     Returns:
         List of question dictionaries
     """
-    questions = []
+    global _INDEX_CACHE
 
-    if difficulty in ["easy", "all"]:
-        try:
-            with open("data/easy_questions.json", "r") as f:
-                questions.extend(json.load(f))
-        except FileNotFoundError:
-            print("Warning: easy_questions.json not found")
+    if _INDEX_CACHE is None:
+        _INDEX_CACHE = _read_index_pickle()
+        if _INDEX_CACHE is None:
+            _INDEX_CACHE = {level: list(_parse_question_file(path))
+                            for level, path in _QUESTION_FILES.items()}
+            _warn_invalid_questions(_INDEX_CACHE)
+            _write_index_pickle(_INDEX_CACHE)
 
-    if difficulty in ["medium", "all"]:
-        try:
-            with open("data/medium_questions.json", "r") as f:
-                questions.extend(json.load(f))
-        except FileNotFoundError:
-            print("Warning: medium_questions.json not found")
+    questions = []
 
-    if difficulty in ["hard", "all"]:
-        try:
-            with open("data/hard_questions.json", "r") as f:
-                questions.extend(json.load(f))
-        except FileNotFoundError:
-            print("Warning: hard_questions.json not found")
+    for level, chunk in _INDEX_CACHE.items():
+        if difficulty in (level, "all"):
+            questions.extend(chunk)
 
     return questions
 
 
+# Fields cheap enough to keep resident for every question; the heavier
+# description/hint/solution bodies stay on disk until requested
+_INDEX_KEYS = ("id", "title", "difficulty", "topics")
+
+
+def load_question_index(difficulty: str = "all") -> List[Dict]:
+    """
+    Load only lightweight question metadata (id, title, difficulty, topics)
+
+    Args:
+        difficulty: "easy", "medium", "hard", or "all"
+
+    Returns:
+        List of light question dictionaries without bodies
+    """
+    return [{k: q[k] for k in _INDEX_KEYS if k in q}
+            for q in load_questions(difficulty)]
+
+
+@functools.lru_cache(maxsize=None)
+def load_question_body(question_id: int) -> Dict:
+    """
+    Load the description, hint, and solution for one question on demand
+
+    Args:
+        question_id: Question id from the index
+
+    Returns:
+        Dictionary of the body fields, memoized per id
+    """
+    for path in _QUESTION_FILES.values():
+        for q in _parse_question_file(path):
+            if q["id"] == question_id:
+                return {k: v for k, v in q.items() if k not in _INDEX_KEYS}
+    raise KeyError(f"Unknown question id: {question_id}")
+
+
 def connect_db(autocommit: bool = False) -> psycopg2.extensions.connection:
     """
     Connect to PostgreSQL database using environment variables
@@ -77,9 +226,46 @@ def connect_db(autocommit: bool = False) -> psycopg2.extensions.connection:
         raise
 
 
+# Pooled connections reused across run_user_query calls so no query pays
+# a fresh TCP + auth handshake, and concurrent workers each check out
+# their own connection instead of serializing on a single shared one.
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+_POOL_MIN = 1
+_POOL_MAX = 8
+
+
+def _get_pool() -> pg_pool.ThreadedConnectionPool:
+    """Return the shared connection pool, creating it lazily"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None or _POOL.closed:
+            _POOL = pg_pool.ThreadedConnectionPool(
+                _POOL_MIN, _POOL_MAX,
+                host=os.getenv("POSTGRES_HOST", "localhost"),
+                port=os.getenv("POSTGRES_PORT", "5432"),
+                dbname=os.getenv("POSTGRES_DB", "interview_db"),
+                user=os.getenv("POSTGRES_USER", "sql_interview"),
+                password=os.getenv("POSTGRES_PASSWORD", "your_password"),
+                application_name="sql_prep"
+            )
+        return _POOL
+
+
+def _close_pool() -> None:
+    """Close all pooled connections on interpreter exit"""
+    if _POOL is not None and not _POOL.closed:
+        _POOL.closeall()
+
+
+atexit.register(_close_pool)
+
+
 def execute_query(conn: psycopg2.extensions.connection,
                   query: str,
-                  fetch: bool = True) -> Optional[Tuple[List[Tuple], List[str]]]:
+                  fetch: bool = True,
+                  params: Optional[Tuple] = None) -> Optional[Tuple[List[Tuple], List[str]]]:
     """
     Execute a SQL query and return results
 
@@ -87,13 +273,15 @@ def execute_query(conn: psycopg2.extensions.connection,
         conn: Database connection
         query: SQL query string
         fetch: Whether to fetch results (False for DDL/DML statements)
+        params: Optional query parameters, bound by the driver instead
+            of interpolated into the statement text
 
     Returns:
         Tuple of (results, column_names) if fetch=True, None otherwise
     """
     try:
         with conn.cursor() as cur:
-            cur.execute(query)
+            cur.execute(query, params)
 
             if fetch and cur.description:
                 results = cur.fetchall()
@@ -108,55 +296,172 @@ def execute_query(conn: psycopg2.extensions.connection,
         raise Exception(f"Query execution error: {e}")
 
 
-def run_user_query(query: str) -> Dict[str, Any]:
+def build_row_count_query(tables: List[str]) -> sql.Composed:
+    """
+    Build a single UNION ALL query counting the rows of each table
+
+    Table names are composed with sql.Identifier so they are quoted
+    safely instead of being interpolated into the statement text, which
+    also gives the server an identical statement to reuse plans for.
+
+    Args:
+        tables: Table names to count
+
+    Returns:
+        A psycopg2 sql.Composed ready to pass to run_user_query
+    """
+    return sql.SQL("\nUNION ALL\n").join(
+        sql.SQL("SELECT {} AS table_name, COUNT(*) AS row_count FROM {}")
+        .format(sql.Literal(t), sql.Identifier(t))
+        for t in tables
+    )
+
+
+# Statements that produce a result set without modifying data
+_SELECT_RE = re.compile(r"^\s*(SELECT|WITH|VALUES|TABLE|SHOW|EXPLAIN)\b",
+                        re.IGNORECASE)
+
+# The subset DECLARE ... CURSOR FOR accepts; EXPLAIN and SHOW produce
+# rows but cannot be streamed through a named cursor
+_CURSOR_RE = re.compile(r"^\s*(SELECT|WITH|VALUES|TABLE)\b",
+                        re.IGNORECASE)
+
+# Rows buffered per page when streaming through a named cursor
+_STREAM_ITERSIZE = 500
+
+
+def _fetch_limited(conn: psycopg2.extensions.connection,
+                   query: str,
+                   params: Optional[Tuple],
+                   limit: int) -> Tuple[List[Tuple], List[str], bool]:
+    """
+    Fetch at most limit rows for one query, reporting truncation
+
+    SELECT-like statements run through a named server-side cursor so the
+    server streams pages instead of the client materializing the full
+    result set; other statements fall back to a bounded fetchmany.
+    """
+    if _CURSOR_RE.match(query):
+        cur = conn.cursor(name="sql_prep_stream")
+        cur.itersize = _STREAM_ITERSIZE
+    else:
+        cur = conn.cursor()
+
+    # On error the failed portal dies with the aborted subtransaction, so
+    # the cursor must not be CLOSEd — let the exception propagate and the
+    # caller roll back to its savepoint
+    cur.execute(query, params)
+    if cur.description is None:
+        cur.close()
+        return [], [], False
+
+    rows = cur.fetchmany(limit + 1)
+    columns = [desc[0] for desc in cur.description]
+    cur.close()
+
+    truncated = len(rows) > limit
+    if truncated:
+        del rows[limit:]
+    return rows, columns, truncated
+
+
+# Statements safe to serve from the session result cache. Kept narrower
+# than _SELECT_RE: a WITH can wrap data-modifying CTEs, but everything
+# run here is rolled back anyway, so caching one is still sound.
+_READONLY_RE = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+
+
+def run_user_query(query: str,
+                   params: Optional[Tuple] = None,
+                   limit: Optional[int] = None) -> Dict[str, Any]:
     """
     Run user's SQL query in a safe transaction context
 
+    Plain read-only queries (no params, no limit) are served from a
+    small session cache, so repeated introspection like schema listings
+    costs zero round trips until the cache is invalidated by a
+    non-SELECT statement or a database setup.
+
     Args:
         query: User's SQL query
+        params: Optional query parameters, bound by the driver so the
+            server can reuse the parsed statement across calls
+        limit: When set, fetch at most this many rows (streamed through
+            a server-side cursor) and flag the result as truncated if
+            more exist
 
     Returns:
         Dictionary with success status, results, column names, and error message
     """
+    if params is None and limit is None and isinstance(query, str) \
+            and _READONLY_RE.match(query):
+        result = _run_cached(query)
+        if not result["success"]:
+            # Don't let a transient failure (e.g. server restart) stick
+            _run_cached.cache_clear()
+        # Copy the mutable layers so callers can't corrupt the cache
+        result = dict(result)
+        if result["results"] is not None:
+            result["results"] = list(result["results"])
+        return result
+
+    result = _run_query(query, params, limit)
+    if isinstance(query, str) and not _READONLY_RE.match(query):
+        # A write (or anything unrecognized) may have changed what the
+        # cached reads would see
+        _run_cached.cache_clear()
+    return result
+
+
+@functools.lru_cache(maxsize=64)
+def _run_cached(query: str) -> Dict[str, Any]:
+    """Session cache over _run_query for read-only statements"""
+    return _run_query(query, None, None)
+
+
+def _run_query(query: str,
+               params: Optional[Tuple],
+               limit: Optional[int]) -> Dict[str, Any]:
+    """Execute one query under a savepoint on a pooled connection"""
     conn = None
+    pool = None
     try:
-        conn = connect_db()
-
-        # Use a savepoint to safely test the query
-        with conn.cursor() as cur:
-            cur.execute("SAVEPOINT test_query;")
-
+        pool = _get_pool()
+        conn = pool.getconn()
+
+        if isinstance(query, str) and _SELECT_RE.match(query):
+            # Read-only fast path: no savepoint round-trips. The
+            # read-only session flag stops a data-modifying CTE from
+            # sneaking a write past the regex; one that tries is legal
+            # SQL, so it gets retried through the savepoint path below.
+            retry_writable = False
             try:
-                cur.execute(query)
-
-                if cur.description:
-                    results = cur.fetchall()
-                    column_names = [desc[0] for desc in cur.description]
-
-                    # Rollback to savepoint to undo any changes
-                    cur.execute("ROLLBACK TO SAVEPOINT test_query;")
-
+                conn.set_session(readonly=True)
+                if limit is not None:
+                    results, column_names, truncated = \
+                        _fetch_limited(conn, query, params, limit)
                     return {
                         "success": True,
                         "results": results,
                         "columns": column_names,
                         "row_count": len(results),
+                        "truncated": truncated,
                         "error": None
                     }
-                else:
-                    # Query doesn't return results (e.g., UPDATE, DELETE)
-                    cur.execute("ROLLBACK TO SAVEPOINT test_query;")
-                    return {
-                        "success": True,
-                        "results": [],
-                        "columns": [],
-                        "row_count": 0,
-                        "error": None,
-                        "message": "Query executed successfully (no results returned)"
-                    }
-
+                with conn.cursor() as cur:
+                    cur.execute(query, params)
+                    results = cur.fetchall()
+                    column_names = [desc[0] for desc in cur.description]
+                return {
+                    "success": True,
+                    "results": results,
+                    "columns": column_names,
+                    "row_count": len(results),
+                    "error": None
+                }
+            except pg_errors.ReadOnlySqlTransaction:
+                retry_writable = True
             except Error as e:
-                cur.execute("ROLLBACK TO SAVEPOINT test_query;")
                 return {
                     "success": False,
                     "results": None,
@@ -164,8 +469,83 @@ def run_user_query(query: str) -> Dict[str, Any]:
                     "row_count": 0,
                     "error": str(e)
                 }
+            finally:
+                conn.rollback()
+                conn.set_session(readonly=False)
+                if not retry_writable:
+                    pool.putconn(conn)
+                    conn = None
+
+        try:
+            # Use a savepoint to safely test the query
+            with conn.cursor() as cur:
+                cur.execute("SAVEPOINT test_query;")
+
+                try:
+                    if limit is not None:
+                        results, column_names, truncated = \
+                            _fetch_limited(conn, query, params, limit)
+                        cur.execute("ROLLBACK TO SAVEPOINT test_query;")
+                        return {
+                            "success": True,
+                            "results": results,
+                            "columns": column_names,
+                            "row_count": len(results),
+                            "truncated": truncated,
+                            "error": None
+                        }
+
+                    cur.execute(query, params)
+
+                    if cur.description:
+                        results = cur.fetchall()
+                        column_names = [desc[0] for desc in cur.description]
+
+                        # Rollback to savepoint to undo any changes
+                        cur.execute("ROLLBACK TO SAVEPOINT test_query;")
+
+                        return {
+                            "success": True,
+                            "results": results,
+                            "columns": column_names,
+                            "row_count": len(results),
+                            "error": None
+                        }
+                    else:
+                        # Query doesn't return results (e.g., UPDATE, DELETE)
+                        cur.execute("ROLLBACK TO SAVEPOINT test_query;")
+                        return {
+                            "success": True,
+                            "results": [],
+                            "columns": [],
+                            "row_count": 0,
+                            "error": None,
+                            "message": "Query executed successfully (no results returned)"
+                        }
+
+                except Error as e:
+                    cur.execute("ROLLBACK TO SAVEPOINT test_query;")
+                    return {
+                        "success": False,
+                        "results": None,
+                        "columns": None,
+                        "row_count": 0,
+                        "error": str(e)
+                    }
+        finally:
+            # End the transaction and hand the connection back clean
+            conn.rollback()
+            pool.putconn(conn)
+            conn = None
 
     except Exception as e:
+        # The connection may be unusable (e.g. server dropped it); have
+        # the pool discard it so the next checkout reconnects
+        if conn is not None and pool is not None:
+            try:
+                pool.putconn(conn, close=True)
+            except Exception:
+                conn.close()
         return {
             "success": False,
             "results": None,
@@ -174,9 +554,103 @@ def run_user_query(query: str) -> Dict[str, Any]:
             "error": str(e)
         }
 
+
+# Statement names already PREPAREd, tracked per pooled connection (keyed
+# by id). Each PREPARE is committed immediately: statements prepared
+# inside a rolled back transaction would otherwise be deallocated again.
+# A stale entry (id reuse after a connection is replaced) only costs one
+# failed EXECUTE, which falls back to plain execution below.
+_PREPARED: Dict[int, set] = {}
+
+
+def run_prepared_query(name: str, query: str) -> Dict[str, Any]:
+    """
+    Run a deterministic query through a server-side prepared statement
+
+    The SQL is PREPAREd once per connection and EXECUTEd afterwards, so
+    the server skips re-parsing and re-planning on repeat runs. Falls
+    back to plain execution when the statement cannot be prepared.
+
+    Args:
+        name: Statement name, unique per SQL text
+        query: SQL text to prepare on first use
+
+    Returns:
+        Same result dictionary as run_user_query
+    """
+    conn = None
+    try:
+        pool = _get_pool()
+        conn = pool.getconn()
+
+        prepared = _PREPARED.setdefault(id(conn), set())
+        if name not in prepared:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        sql.SQL("PREPARE {} AS {}").format(
+                            sql.Identifier(name), sql.SQL(query)))
+                conn.commit()
+                prepared.add(name)
+            except Error:
+                # Multi-statement or otherwise unpreparable SQL
+                conn.rollback()
+                return run_user_query(query)
+
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"EXECUTE {name};")
+                results = cur.fetchall()
+                column_names = [desc[0] for desc in cur.description]
+            conn.rollback()
+            return {
+                "success": True,
+                "results": results,
+                "columns": column_names,
+                "row_count": len(results),
+                "error": None
+            }
+        except Error:
+            # The statement was deallocated server-side; re-prepare on a
+            # later call
+            conn.rollback()
+            prepared.discard(name)
+            return run_user_query(query)
+    except Exception:
+        if conn is not None:
+            try:
+                pool.putconn(conn, close=True)
+            except Exception:
+                conn.close()
+            conn = None
+        return run_user_query(query)
     finally:
-        if conn:
-            conn.close()
+        if conn is not None:
+            pool.putconn(conn)
+
+
+def _normalize_list(value: List) -> Tuple:
+    """Hashable form of an array cell, elements normalized recursively"""
+    return tuple(map(normalize_value, value))
+
+
+def _normalize_dict(value: Dict) -> Tuple:
+    """Hashable form of a json/jsonb cell, keyed in sorted order"""
+    return tuple(sorted((k, normalize_value(v)) for k, v in value.items()))
+
+
+# Per-type converters for comparison normalization. Exact-type dispatch
+# through type(v) replaces the isinstance chain and its MRO walks; the
+# driver hands back exact Decimal/datetime/date instances, so subclass
+# handling is not needed here. Arrays and json/jsonb arrive as lists
+# and dicts, which must become hashable for the Counter comparison.
+_NORMALIZERS = {
+    Decimal: float,
+    datetime: str,
+    date: str,
+    list: _normalize_list,
+    dict: _normalize_dict,
+}
 
 
 def normalize_value(value: Any) -> Any:
@@ -189,14 +663,8 @@ def normalize_value(value: Any) -> Any:
     Returns:
         Normalized value
     """
-    if isinstance(value, Decimal):
-        return float(value)
-    elif isinstance(value, (datetime, date)):
-        return str(value)
-    elif value is None:
-        return None
-    else:
-        return value
+    fn = _NORMALIZERS.get(type(value))
+    return fn(value) if fn is not None else value
 
 
 def normalize_row(row: Tuple) -> Tuple:
@@ -209,7 +677,7 @@ def normalize_row(row: Tuple) -> Tuple:
     Returns:
         Normalized tuple
     """
-    return tuple(normalize_value(v) for v in row)
+    return tuple(map(normalize_value, row))
 
 
 def compare_results(user_results: List[Tuple],
@@ -228,22 +696,21 @@ def compare_results(user_results: List[Tuple],
     Returns:
         Dictionary with comparison results
     """
-    # Normalize results
-    user_normalized = [normalize_row(row) for row in user_results]
-    expected_normalized = [normalize_row(row) for row in expected_results]
-
-    # Sort both for comparison (order might differ)
-    user_sorted = sorted(user_normalized)
-    expected_sorted = sorted(expected_normalized)
-
     # Check column names (case-insensitive)
     user_cols_lower = [col.lower() for col in user_columns]
     expected_cols_lower = [col.lower() for col in expected_columns]
 
     columns_match = set(user_cols_lower) == set(expected_cols_lower)
 
-    # Check if results match
-    results_match = user_sorted == expected_sorted
+    # Differing row counts can never match; skip normalizing and hashing
+    if len(user_results) != len(expected_results):
+        results_match = False
+    else:
+        # Order might differ between queries, so compare as multisets;
+        # Counter equality is linear where sorting was O(n log n) and
+        # never compares rows of mixed types
+        results_match = (Counter(map(normalize_row, user_results)) ==
+                         Counter(map(normalize_row, expected_results)))
 
     return {
         "columns_match": columns_match,
@@ -256,6 +723,105 @@ def compare_results(user_results: List[Tuple],
     }
 
 
+def validate_against(user_query: str, solution_query: str) -> Dict[str, Any]:
+    """
+    Validate a user query against a solution query server-side
+
+    Runs an EXCEPT ALL/COUNT harness so only four counters cross the
+    wire instead of both full result sets. EXCEPT ALL keeps bag
+    semantics, so duplicate-multiplicity differences are caught; shapes
+    it cannot handle fall back to the client-side comparison.
+
+    Args:
+        user_query: User's SQL query
+        solution_query: Reference solution query
+
+    Returns:
+        Dictionary shaped like compare_results' output, plus a "success"
+        flag and an "error" message when neither query could be run
+    """
+    user_q = user_query.rstrip().rstrip(";")
+    solution_q = solution_query.rstrip().rstrip(";")
+
+    # Column names come from zero-row probes of each query
+    user_probe = run_user_query(f"SELECT * FROM ({user_q}) AS _u LIMIT 0")
+    if not user_probe["success"]:
+        return {"success": False, "error": user_probe["error"]}
+
+    solution_probe = run_user_query(
+        f"SELECT * FROM ({solution_q}) AS _s LIMIT 0")
+    if not solution_probe["success"]:
+        return {"success": False, "error": solution_probe["error"]}
+
+    user_cols = user_probe["columns"]
+    expected_cols = solution_probe["columns"]
+    columns_match = ({c.lower() for c in user_cols}
+                     == {c.lower() for c in expected_cols})
+
+    if not columns_match or len(user_cols) != len(expected_cols):
+        # EXCEPT needs compatible shapes, and a column mismatch already
+        # proves the answer wrong; fetch only the row counts
+        counts = run_user_query(
+            f"SELECT (SELECT COUNT(*) FROM ({user_q}) AS _uc), "
+            f"(SELECT COUNT(*) FROM ({solution_q}) AS _sc)")
+        uc, sc = counts["results"][0] if counts["success"] else (0, 0)
+        return {
+            "success": True,
+            "columns_match": False,
+            "results_match": False,
+            "correct": False,
+            "user_row_count": uc,
+            "expected_row_count": sc,
+            "user_columns": user_cols,
+            "expected_columns": expected_cols,
+        }
+
+    harness = (
+        "SELECT "
+        f"(SELECT COUNT(*) FROM (({user_q}) EXCEPT ALL ({solution_q})) AS _um), "
+        f"(SELECT COUNT(*) FROM (({solution_q}) EXCEPT ALL ({user_q})) AS _sm), "
+        f"(SELECT COUNT(*) FROM ({user_q}) AS _uc), "
+        f"(SELECT COUNT(*) FROM ({solution_q}) AS _sc)"
+    )
+    result = run_user_query(harness)
+
+    if not result["success"]:
+        # Shape-compatible but type-incompatible for EXCEPT: compare on
+        # the client as before
+        user_res = run_user_query(user_q)
+        solution_res = run_user_query(solution_q)
+        if not (user_res["success"] and solution_res["success"]):
+            error = (user_res if not user_res["success"]
+                     else solution_res)["error"]
+            return {"success": False, "error": error}
+        comparison = compare_results(user_res["results"],
+                                     solution_res["results"],
+                                     user_res["columns"],
+                                     solution_res["columns"])
+        comparison["success"] = True
+        return comparison
+
+    user_minus_sol, sol_minus_user, uc, sc = result["results"][0]
+    # EXCEPT ALL keeps duplicates, so two empty differences already
+    # prove the multisets equal; the counts are reported, not compared
+    results_match = user_minus_sol == 0 and sol_minus_user == 0
+    return {
+        "success": True,
+        "columns_match": columns_match,
+        "results_match": results_match,
+        "correct": columns_match and results_match,
+        "user_row_count": uc,
+        "expected_row_count": sc,
+        "user_columns": user_cols,
+        "expected_columns": expected_cols,
+    }
+
+
+def _s(value: Any) -> str:
+    """None-safe display string for one table cell"""
+    return "NULL" if value is None else str(value)
+
+
 def format_table(results: List[Tuple], columns: List[str], max_rows: int = 20) -> str:
     """
     Format query results as a readable table
@@ -271,78 +837,147 @@ def format_table(results: List[Tuple], columns: List[str], max_rows: int = 20) -
     if not results:
         return "No results returned"
 
-    # Calculate column widths
-    col_widths = [len(col) for col in columns]
+    # Stringify every cell exactly once; widths and formatting both work
+    # off the string form, and map keeps the None branch out of the
+    # inner loop bytecode
+    rows_str = [tuple(map(_s, row)) for row in results[:max_rows]]
 
-    for row in results[:max_rows]:
-        for i, val in enumerate(row):
-            val_str = str(val) if val is not None else "NULL"
-            col_widths[i] = max(col_widths[i], len(val_str))
+    col_widths = [
+        max(len(col), *(len(row[i]) for row in rows_str))
+        for i, col in enumerate(columns)
+    ]
 
     # Create separator
     separator = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
 
-    # Format header
-    header = "|" + "|".join(f" {col:{w}} " for col, w in zip(columns, col_widths)) + "|"
+    # Specialize one format string for these widths so the format spec
+    # is parsed once per table, not once per cell
+    row_fmt = "| " + " | ".join("{:<%d}" % w for w in col_widths) + " |"
 
-    # Format rows
-    rows = []
-    for row in results[:max_rows]:
-        formatted_vals = []
-        for val, w in zip(row, col_widths):
-            val_str = str(val) if val is not None else "NULL"
-            formatted_vals.append(f" {val_str:{w}} ")
-        rows.append("|" + "|".join(formatted_vals) + "|")
+    header = row_fmt.format(*columns)
 
-    # Combine all parts
-    table = [separator, header, separator] + rows + [separator]
+    # Feed the pieces to join lazily instead of concatenating lists
+    hidden = len(results) - max_rows
+    return "\n".join(itertools.chain(
+        (separator, header, separator),
+        (row_fmt.format(*row) for row in rows_str),
+        (separator,),
+        (f"\n... ({hidden} more rows)",) if hidden > 0 else ()
+    ))
 
-    if len(results) > max_rows:
-        table.append(f"\n... ({len(results) - max_rows} more rows)")
 
-    return "\n".join(table)
+# Fields every question must carry; a frozenset turns the per-question
+# check into one hash-based difference instead of five list scans
+_REQUIRED_FIELDS = frozenset(
+    ("id", "title", "description", "solution", "difficulty"))
 
 
-def validate_question(question: Dict) -> bool:
+def validate_question(question: Dict) -> Tuple[bool, frozenset]:
     """
     Validate that a question has all required fields
 
+    Stays silent so a caller looping over the catalog can aggregate the
+    findings into one warning instead of printing per question.
+
     Args:
         question: Question dictionary
 
     Returns:
-        True if valid, False otherwise
+        Tuple of (valid, missing field names)
     """
-    required_fields = ["id", "title", "description", "solution", "difficulty"]
+    missing = _REQUIRED_FIELDS.difference(question)
+    return (not missing, frozenset(missing))
 
-    for field in required_fields:
-        if field not in question:
-            print(f"Warning: Question missing required field: {field}")
-            return False
 
-    return True
+def _split_sql_statements(script: str) -> List[str]:
+    """
+    Split a SQL script on statement-terminating semicolons
+
+    Understands single-quoted strings, dollar-quoted bodies, and line
+    and block comments, so semicolons inside any of those do not end a
+    statement. Kept hand-rolled to avoid a sqlparse dependency for one
+    setup path.
+
+    Args:
+        script: Full SQL script text
+
+    Returns:
+        List of individual statements, whitespace-stripped, without
+        trailing semicolons
+    """
+    statements = []
+    start = 0
+    i = 0
+    n = len(script)
+    while i < n:
+        ch = script[i]
+        if ch == "'":
+            # Skip the string literal; '' is an escaped quote
+            i += 1
+            while i < n:
+                if script[i] == "'":
+                    if i + 1 < n and script[i + 1] == "'":
+                        i += 2
+                        continue
+                    break
+                i += 1
+        elif ch == "$":
+            # Dollar quoting: $tag$ ... $tag$
+            m = re.match(r"\$[A-Za-z_]*\$", script[i:])
+            if m:
+                tag = m.group(0)
+                end = script.find(tag, i + len(tag))
+                i = (end + len(tag) - 1) if end != -1 else n - 1
+        elif ch == "-" and script[i:i + 2] == "--":
+            nl = script.find("\n", i)
+            i = nl if nl != -1 else n - 1
+        elif ch == "/" and script[i:i + 2] == "/*":
+            end = script.find("*/", i + 2)
+            i = (end + 1) if end != -1 else n - 1
+        elif ch == ";":
+            stmt = script[start:i].strip()
+            if stmt:
+                statements.append(stmt)
+            start = i + 1
+        i += 1
+
+    tail = script[start:].strip()
+    if tail:
+        statements.append(tail)
+    return statements
 
 
 def setup_database(sql_file: str = "setup_db.sql") -> bool:
     """
     Set up the database by executing the setup SQL script
 
+    The script is split into individual statements so the server parses
+    and runs them one at a time; a syntax error surfaces at the first
+    broken statement instead of after parsing the whole file. All
+    statements run inside one transaction, so a mid-script failure
+    rolls the whole rebuild back instead of leaving it half done.
+
     Args:
         sql_file: Path to SQL setup file
 
     Returns:
         True if successful, False otherwise
     """
+    conn = None
     try:
-        conn = connect_db(autocommit=True)
+        conn = connect_db()
 
         with open(sql_file, 'r') as f:
             sql_script = f.read()
 
         with conn.cursor() as cur:
-            cur.execute(sql_script)
+            for statement in _split_sql_statements(sql_script):
+                cur.execute(statement)
 
+        conn.commit()
         conn.close()
+        # Tables were rebuilt; cached read results are stale now
+        _run_cached.cache_clear()
         print("Database setup completed successfully!")
         return True
 
@@ -352,6 +987,9 @@ def setup_database(sql_file: str = "setup_db.sql") -> bool:
 
     except Error as e:
         print(f"Error setting up database: {e}")
+        if conn is not None:
+            conn.rollback()
+            conn.close()
         return False
 
 